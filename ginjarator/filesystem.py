@@ -30,16 +30,24 @@ class Filesystem:
         self.build = (root / "build").resolve()
 
     def write_text(self, path: pathlib.Path, contents: str) -> None:
-        """Writes a string to a file, preserving mtime if nothing changed."""
+        """Writes a string to a file, preserving mtime if nothing changed.
+
+        The file is written as UTF-8. If it already exists with a different
+        size, it's rewritten without reading the old contents.
+        """
         full_path = (self._root / path).resolve()
         if not full_path.is_relative_to(self.build):
             raise ValueError(
                 f"Only the build directory can be written to, not {str(path)!r}"
             )
+        data = contents.encode()
         try:
-            if contents == full_path.read_text():
+            if (
+                full_path.stat().st_size == len(data)
+                and full_path.read_bytes() == data
+            ):
                 return
         except FileNotFoundError:
             pass
         full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(contents)
+        full_path.write_bytes(data)
@@ -14,8 +14,8 @@
 
 # pylint: disable=missing-module-docstring
 
+import os
 import pathlib
-import time
 
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -23,9 +23,13 @@ from absl.testing import parameterized
 from ginjarator import filesystem
 
 
-def _sleep_for_mtime() -> None:
-    """Prevents writes before/after calling this from having the same mtime."""
-    time.sleep(0.01)
+def _backdate_mtime(path: pathlib.Path) -> None:
+    """Prevents writes after calling this from having the same mtime."""
+    stat = path.stat()
+    os.utime(
+        path,
+        ns=(stat.st_atime_ns - 1_000_000_000, stat.st_mtime_ns - 1_000_000_000),
+    )
 
 
 class FilesystemTest(parameterized.TestCase):
@@ -46,13 +50,13 @@ class FilesystemTest(parameterized.TestCase):
         full_path = self._root / path
         full_path.parent.mkdir(parents=True)
         full_path.write_text(contents)
-        original_mtime = full_path.stat().st_mtime
-        _sleep_for_mtime()
+        _backdate_mtime(full_path)
+        original_mtime = full_path.stat().st_mtime_ns
 
         self._fs.write_text(path, contents)
 
         self.assertEqual(contents, full_path.read_text())
-        self.assertEqual(original_mtime, full_path.stat().st_mtime)
+        self.assertEqual(original_mtime, full_path.stat().st_mtime_ns)
 
     def test_write_text_writes_new_file(self) -> None:
         contents = "the contents of the file"
@@ -63,19 +67,29 @@ class FilesystemTest(parameterized.TestCase):
 
         self.assertEqual(contents, full_path.read_text())
 
-    def test_write_text_updates_file(self) -> None:
+    @parameterized.named_parameters(
+        dict(
+            testcase_name="different_size",
+            original_contents="original contents of the file",
+        ),
+        dict(
+            testcase_name="same_size",
+            original_contents="THE CONTENTS OF THE FILE",
+        ),
+    )
+    def test_write_text_updates_file(self, original_contents: str) -> None:
         contents = "the contents of the file"
         path = pathlib.Path("build/some-file")
         full_path = self._root / path
         full_path.parent.mkdir(parents=True)
-        full_path.write_text("original contents of the file")
-        original_mtime = full_path.stat().st_mtime
-        _sleep_for_mtime()
+        full_path.write_text(original_contents)
+        _backdate_mtime(full_path)
+        original_mtime = full_path.stat().st_mtime_ns
 
         self._fs.write_text(path, contents)
 
         self.assertEqual(contents, full_path.read_text())
-        self.assertLess(original_mtime, full_path.stat().st_mtime)
+        self.assertLess(original_mtime, full_path.stat().st_mtime_ns)
 
 
 if __name__ == "__main__":